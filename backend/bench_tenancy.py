@@ -0,0 +1,148 @@
+"""Benchmark filtered search cost as the corpus grows.
+
+Compares the old single-collection layout (source filter only, no payload
+indexes) with the tenant-partitioned layout used in retrieval.py
+(is_tenant index on metadata.tenant_id, keyword index on metadata.source,
+per-tenant HNSW graphs). Random vectors are used so no embedding model is needed.
+
+Usage:
+    python bench_tenancy.py            # uses QDRANT_URL / QDRANT_API_KEY
+"""
+from qdrant_client import QdrantClient, models
+from dotenv import load_dotenv
+import numpy as np
+import time
+import os
+
+load_dotenv()
+
+QDRANT_URL = os.environ.get("QDRANT_URL", "http://localhost:6333")
+QDRANT_API_KEY = os.environ.get("QDRANT_API_KEY")
+
+DIM = 768
+DOCS_PER_TENANT = 5
+CHUNKS_PER_DOC = 200
+TENANT_STEPS = [5, 20, 50, 100]
+QUERIES = 50
+
+client = QdrantClient(url=QDRANT_URL, api_key=QDRANT_API_KEY, timeout=120)
+data_rng = np.random.default_rng(42)
+query_rng = np.random.default_rng(7)
+
+
+def create_collection(name, partitioned):
+    """Create a benchmark collection with either the old or the tenant-partitioned layout"""
+
+    if client.collection_exists(name):
+        client.delete_collection(name)
+
+    if partitioned:
+        hnsw = models.HnswConfigDiff(m=0, payload_m=16, ef_construct=100, full_scan_threshold=10000)
+    else:
+        hnsw = models.HnswConfigDiff(m=16, ef_construct=100, full_scan_threshold=10000)
+
+    client.create_collection(
+        collection_name=name,
+        vectors_config=models.VectorParams(size=DIM, distance=models.Distance.COSINE),
+        hnsw_config=hnsw
+    )
+
+    if partitioned:
+        client.create_payload_index(
+            collection_name=name,
+            field_name="metadata.tenant_id",
+            field_schema=models.KeywordIndexParams(type=models.KeywordIndexType.KEYWORD, is_tenant=True)
+        )
+        client.create_payload_index(
+            collection_name=name,
+            field_name="metadata.source",
+            field_schema=models.PayloadSchemaType.KEYWORD
+        )
+
+
+def make_points(start, stop):
+    """DOCS_PER_TENANT documents for every tenant in [start, stop), grouped per tenant"""
+
+    batches = []
+    for t in range(start, stop):
+        points = []
+        for d in range(DOCS_PER_TENANT):
+            vectors = data_rng.standard_normal((CHUNKS_PER_DOC, DIM), dtype=np.float32)
+            for c, vector in enumerate(vectors):
+                points.append(models.PointStruct(
+                    id=(t * DOCS_PER_TENANT + d) * CHUNKS_PER_DOC + c,
+                    vector=vector.tolist(),
+                    payload={"metadata": {"tenant_id": f"tenant-{t}", "source": f"tenant-{t}-doc-{d}"}}
+                ))
+        batches.append(points)
+
+    return batches
+
+
+def make_queries(n_tenants):
+    """Draw (tenant, doc, vector) triples so every layout runs the exact same searches"""
+
+    queries = []
+    for _ in range(QUERIES):
+        t = int(query_rng.integers(n_tenants))
+        d = int(query_rng.integers(DOCS_PER_TENANT))
+        queries.append((t, d, query_rng.standard_normal(DIM).tolist()))
+
+    return queries
+
+
+def wait_for_green(name):
+    """Block until Qdrant has finished indexing the collection"""
+
+    while client.get_collection(name).status != models.CollectionStatus.GREEN:
+        time.sleep(0.5)
+
+
+def search_latency(name, queries, partitioned):
+    """Mean latency (ms) of a per-document search, as issued by query_policy"""
+
+    timings = []
+    for t, d, vector in queries:
+        must = [models.FieldCondition(key="metadata.source", match=models.MatchValue(value=f"tenant-{t}-doc-{d}"))]
+        if partitioned:
+            must.insert(0, models.FieldCondition(key="metadata.tenant_id", match=models.MatchValue(value=f"tenant-{t}")))
+
+        start = time.perf_counter()
+        client.query_points(
+            collection_name=name,
+            query=vector,
+            query_filter=models.Filter(must=must),
+            limit=2
+        )
+        timings.append(time.perf_counter() - start)
+
+    return 1000 * sum(timings) / len(timings)
+
+
+def main():
+    layouts = {"bench_single": False, "bench_partitioned": True}
+    for name, partitioned in layouts.items():
+        create_collection(name, partitioned)
+
+    print(f"{'chunks':>10} {'single (ms)':>12} {'partitioned (ms)':>17}")
+    loaded = 0
+    for n_tenants in TENANT_STEPS:
+        batches = make_points(loaded, n_tenants)
+        queries = make_queries(n_tenants)
+        row = {}
+        for name, partitioned in layouts.items():
+            for points in batches:
+                client.upload_points(collection_name=name, points=points, wait=True)
+            wait_for_green(name)
+            row[name] = search_latency(name, queries, partitioned)
+        loaded = n_tenants
+
+        total = n_tenants * DOCS_PER_TENANT * CHUNKS_PER_DOC
+        print(f"{total:>10} {row['bench_single']:>12.2f} {row['bench_partitioned']:>17.2f}")
+
+    for name in layouts:
+        client.delete_collection(name)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,11 @@ import sys, os
 print("STARTUP: main.py import started", flush=True)
 print("ENV PORT:", os.environ.get("PORT"), flush=True)
 
-from fastapi import FastAPI, UploadFile, HTTPException
+from fastapi import FastAPI, UploadFile, HTTPException, Form
 from fastapi.middleware.cors import CORSMiddleware
 import tempfile
 from inference import run_inference, classify_document, extract_document_advice
-from retrieval import process_pdf, split_documents, embed_vectordb, query_policy, normalize_filename, is_file_already_indexed, fetch_policy
+from retrieval import process_pdf, split_documents, embed_vectordb, query_policy, normalize_filename, normalize_tenant, is_file_already_indexed, fetch_policy, DEFAULT_TENANT
 from schemas import UploadResponse, QueryRequest, QueryResponse, WebSearchRequest, WebSearchResponse, WebQARequest, WebQAResponse
 from web_search import summarize_web_documents
 # import os
@@ -24,7 +24,7 @@ app.add_middleware(
 )
 
 @app.post("/upload", response_model=UploadResponse)
-async def upload_doc(file: UploadFile):
+async def upload_doc(file: UploadFile, tenant_id: str = Form(DEFAULT_TENANT)):
     # Save uploaded file temporarily
     try: 
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
@@ -32,16 +32,17 @@ async def upload_doc(file: UploadFile):
             tmp_path = tmp.name
         
         filename = normalize_filename(file.filename)
-        print(f"Normalized upload filename: {filename}")
+        tenant = normalize_tenant(tenant_id)
+        print(f"Normalized upload filename: {filename} (tenant: {tenant})")
 
 
         #check if already indexed
-        if is_file_already_indexed(filename):
-            chunks = fetch_policy(filename)
+        if is_file_already_indexed(filename, tenant):
+            chunks = fetch_policy(filename, tenant)
 
         else:
             print(f"Indexing new file: {filename}")
-            docs = process_pdf(tmp_path, filename)
+            docs = process_pdf(tmp_path, filename, tenant)
             chunks = split_documents(docs)
             embed_vectordb(chunks)
             print(f"Added {len(chunks)} chunks for {filename}")
@@ -58,7 +59,7 @@ async def upload_doc(file: UploadFile):
 
 @app.post("/query", response_model=QueryResponse)
 async def query_doc(req: QueryRequest):
-    context = query_policy(req.question, req.filename)
+    context = query_policy(req.question, req.filename, req.tenant_id)
     answer = run_inference(req.question, context)
     return QueryResponse(answer=answer)
 
@@ -19,6 +19,11 @@ QDRANT_API_KEY=os.environ.get("QDRANT_API_KEY", "YOUR_QDRANT_API_KEY_HERE")
 # QDRANT_URL = "http://localhost:6333"
 COLLECTION_NAME = "guardian_policies"
 
+# Payload keys used to partition the collection per tenant and per document
+TENANT_KEY = "metadata.tenant_id"
+SOURCE_KEY = "metadata.source"
+DEFAULT_TENANT = "default"
+
 embedding_model = None
 
 qdrant_client = QdrantClient(url=QDRANT_URL, api_key=QDRANT_API_KEY)
@@ -36,22 +41,89 @@ def normalize_filename(filename: str) -> str:
 
     return base.strip().lower()
 
+def normalize_tenant(tenant_id: str) -> str:
+    """Tenant ids are lowercased and stripped, empty falls back to DEFAULT_TENANT"""
+
+    tenant = (tenant_id or "").strip().lower()
+
+    return tenant or DEFAULT_TENANT
+
+def build_filter(tenant_id: str, filename: str = None) -> rest.Filter:
+    """Filter scoped to a tenant and, optionally, a single document of that tenant"""
+
+    must = [rest.FieldCondition(
+        key=TENANT_KEY,
+        match=rest.MatchValue(value=normalize_tenant(tenant_id))
+    )]
+
+    if filename:
+        must.append(rest.FieldCondition(
+            key=SOURCE_KEY,
+            match=rest.MatchValue(value=normalize_filename(filename))
+        ))
+
+    return rest.Filter(must=must)
+
+def init_payload_indexes():
+    """Index tenant and source payloads so filtered searches and scrolls stay cheap"""
+
+    # is_tenant lets Qdrant co-locate each tenant's points on disk
+    qdrant_client.create_payload_index(
+        collection_name=COLLECTION_NAME,
+        field_name=TENANT_KEY,
+        field_schema=models.KeywordIndexParams(
+            type=models.KeywordIndexType.KEYWORD,
+            is_tenant=True
+        )
+    )
+    qdrant_client.create_payload_index(
+        collection_name=COLLECTION_NAME,
+        field_name=SOURCE_KEY,
+        field_schema=models.PayloadSchemaType.KEYWORD
+    )
+
+def migrate_legacy_points():
+    """One-time backfill: chunks stored before tenancy are assigned to DEFAULT_TENANT"""
+
+    qdrant_client.set_payload(
+        collection_name=COLLECTION_NAME,
+        payload={"tenant_id": DEFAULT_TENANT},
+        key="metadata",
+        points=rest.Filter(
+            must=[rest.IsEmptyCondition(is_empty=rest.PayloadField(key=TENANT_KEY))]
+        )
+    )
+
 def init_collection():
+    exists = True
     try:
         qdrant_client.get_collection(COLLECTION_NAME)
         print(f"Collection '{COLLECTION_NAME}' already exists.")
     except Exception:
+        exists = False
         print(f"Collection '{COLLECTION_NAME}' not found. Creating...")
         qdrant_client.recreate_collection(
             collection_name=COLLECTION_NAME,
             vectors_config=models.VectorParams(size=768, distance=models.Distance.COSINE),
             hnsw_config=models.HnswConfigDiff(
-                m=16,                  # graph complexity
+                m=0,                   # no global graph, every search is tenant scoped
+                payload_m=16,          # per-tenant graph complexity
                 ef_construct=100,      # build accuracy
                 full_scan_threshold=10000  # only brute-force for very small sets
             )
         )
 
+    # Kept outside the try above so a failure here never recreates (wipes) the collection
+    if exists:
+        migrate_legacy_points()
+        # Switch existing deployments to per-tenant graphs (triggers an index rebuild)
+        qdrant_client.update_collection(
+            collection_name=COLLECTION_NAME,
+            hnsw_config=models.HnswConfigDiff(m=0, payload_m=16)
+        )
+
+    init_payload_indexes()
+
 # Call once at startup
 init_collection()
 
@@ -62,37 +134,33 @@ vector_store = QdrantVectorStore(
     collection_name=COLLECTION_NAME,
 )
 
-def is_file_already_indexed(filename: str) -> bool:
-    """Check if the file is already in Qdrant by source_file metadata"""
-    
-    normalized = normalize_filename(filename)
-
-    # Use the vector_store itself to search metadata
-    results = vector_store.similarity_search(
-        query="",  # empty string to just filter points
-        k=1,
-        filter={
-            "must": [
-                {"key": f"metadata.source", "match": {"value": normalized}}
-            ]
-        }
-    )
-    if results:
-        print(f"File '{filename}' is already indexed. Found {len(results)} chunks.")
+def is_file_already_indexed(filename: str, tenant_id: str = DEFAULT_TENANT) -> bool:
+    """Check if the file is already in Qdrant for this tenant by source metadata"""
+
+    # Payload-only lookup, served by the tenant/source indexes without embedding anything
+    count = qdrant_client.count(
+        collection_name=COLLECTION_NAME,
+        count_filter=build_filter(tenant_id, filename),
+        exact=True
+    ).count
+    if count:
+        print(f"File '{filename}' is already indexed. Found {count} chunks.")
         return True
     else:
         print(f"File '{filename}' is not indexed yet.")
         return False
 
-def process_pdf(pdf_file, file_name):
+def process_pdf(pdf_file, file_name, tenant_id=DEFAULT_TENANT):
     """Parsing the uploaded pdf into PyPDF DOCS"""
 
     loader = PyPDFLoader(pdf_file)
     documents = loader.load()
 
     normalized_name = normalize_filename(file_name) 
-    # Add source information to metadata
+    tenant = normalize_tenant(tenant_id)
+    # Add tenant and source information to metadata
     for i, doc in enumerate(documents, start=1):
+        doc.metadata["tenant_id"] = tenant
         doc.metadata["source"] = normalized_name
         doc.metadata["file_type"] = "pdf"
         doc.metadata["page_number"] = i
@@ -125,20 +193,10 @@ def embed_vectordb(chunks):
     print(f"Added {len(chunks)} chunks. Total in collection: {count}")
     return {"status": "success", "chunks_added": len(chunks)}
 
-def query_policy(user_query, filename):
-    """Search relevant context for the query within the given file"""
+def query_policy(user_query, filename, tenant_id=DEFAULT_TENANT):
+    """Search relevant context for the query within the given file of the tenant"""
     start = time.time()
-    filter_ = None
-
-    if filename:
-        normalized = normalize_filename(filename)
-       
-        filter_ = rest.Filter(
-            must=[rest.FieldCondition(
-                key="metadata.source",
-                match=rest.MatchValue(value=normalized)
-            )]
-        )
+    filter_ = build_filter(tenant_id, filename)
 
     results = vector_store.similarity_search(
         query=user_query, 
@@ -156,7 +214,7 @@ def query_policy(user_query, filename):
 
     return context
 
-def fetch_policy(filename):
+def fetch_policy(filename, tenant_id=DEFAULT_TENANT):
     print(f"File '{filename}' already exists in DB. Skipping re-index.")
 
     all_chunks = []
@@ -165,14 +223,7 @@ def fetch_policy(filename):
     while True:
         scroll_results, offset = vector_store.client.scroll(
             collection_name=vector_store.collection_name,
-            scroll_filter=rest.Filter(
-                must=[
-                    rest.FieldCondition(
-                        key="metadata.source",
-                        match=rest.MatchValue(value=filename)
-                    )
-                ]
-            ),
+            scroll_filter=build_filter(tenant_id, filename),
             limit=100,  # adjust batch size
             offset=offset,
             with_payload=True,
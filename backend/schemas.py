@@ -9,6 +9,7 @@ class UploadResponse(BaseModel):
 class QueryRequest(BaseModel):
     question: str
     filename: str
+    tenant_id: str = "default"  # workspace the document was uploaded to, keep in sync with retrieval.DEFAULT_TENANT
 
 
 class QueryResponse(BaseModel):
@@ -8,6 +8,9 @@ st.set_page_config(page_title="Guardian – Policy Assistant", layout="wide")
 
 st.title("🛡️ Guardian – Policy Insights Assistant")
 
+# Workspace (tenant) the uploaded documents are stored and searched in
+tenant_id = st.sidebar.text_input("Workspace", value="default")
+
 # ------------------------------------------------
 # Section 1: PDF Upload
 # ------------------------------------------------
@@ -19,11 +22,12 @@ if uploaded_file and "doc_filename" not in st.session_state:
     # Only process the upload once
     with st.spinner("Uploading and analyzing document..."):
         files = {"file": uploaded_file}
-        res = requests.post(f"{API_BASE}/upload", files=files)
+        res = requests.post(f"{API_BASE}/upload", files=files, data={"tenant_id": tenant_id})
         if res.status_code == 200:
             data = res.json()
             st.success("Document processed successfully!")
             st.session_state["doc_filename"] = uploaded_file.name
+            st.session_state["doc_tenant"] = tenant_id
             st.session_state["doc_type"] = data["doc_type"]
             st.session_state["doc_insights"] = data["insights"]
 
@@ -133,7 +137,7 @@ if user_query and selected_context:
         with st.spinner("Thinking..."):
             res = requests.post(
                 f"{API_BASE}/query",
-                json={"question": user_query, "filename": st.session_state["doc_filename"]}
+                json={"question": user_query, "filename": st.session_state["doc_filename"], "tenant_id": st.session_state["doc_tenant"]}
             )
             if res.status_code == 200:
                 answer = res.json()["answer"]